@@ -0,0 +1,37 @@
+// Brochure download link that prefetches the PDF once it scrolls into view, the way next/link warms page routes.
+// next/link itself only prefetches routes, and the brochure is a static asset, so the hint is a plain
+// <link rel="prefetch"> keyed so several BrochureLinks on the page share one.
+
+import Head from 'next/head';
+import { startTransition, useEffect, useRef, useState } from 'react';
+import { BROCHURE_URL } from '../lib/assets';
+
+export default function BrochureLink({ className, children }) {
+  const linkRef = useRef(null);
+  const [prefetch, setPrefetch] = useState(false);
+
+  // Skipped under Data Saver; the /assets Cache-Control keeps the prefetched copy fresh for the click
+  useEffect(() => {
+    if (navigator.connection?.saveData === true) return;
+    if (typeof IntersectionObserver === 'undefined') return;
+    const obs = new IntersectionObserver(([entry]) => {
+      if (entry.isIntersecting) {
+        startTransition(() => setPrefetch(true));
+        obs.disconnect();
+      }
+    });
+    obs.observe(linkRef.current);
+    return () => obs.disconnect();
+  }, []);
+
+  return (
+    <>
+      {prefetch && (
+        <Head>
+          <link key="brochure-prefetch" rel="prefetch" href={BROCHURE_URL} />
+        </Head>
+      )}
+      <a ref={linkRef} href={BROCHURE_URL} download rel="noopener" referrerPolicy="no-referrer" className={className}>{children}</a>
+    </>
+  );
+}
@@ -0,0 +1,248 @@
+// Quote request form — reCAPTCHA v3 loading, token minting and the single /api/submit POST.
+// Everything interactive about the quote flow lives here; the rest of the landing page is static markup.
+
+import dynamic from 'next/dynamic';
+import { memo, startTransition, useCallback, useEffect, useRef, useState } from 'react';
+import BrochureLink from './BrochureLink';
+
+// Always inlined at build time (next.config.js `env` defaults it to ''). When it is empty, RecaptchaScript below is never defined, so its
+// chunk and every reCAPTCHA branch in this file are dropped from the client bundle.
+const RECAPTCHA_KEY = process.env.NEXT_PUBLIC_RECAPTCHA_SITE_KEY;
+const RecaptchaScript = RECAPTCHA_KEY ? dynamic(() => import('./RecaptchaScript'), { ssr: false }) : null;
+
+// reCAPTCHA v3 tokens expire after 120s; refresh a little early so a cached token is never stale on arrival
+const RECAPTCHA_TOKEN_TTL_MS = 110_000;
+
+// Upper bound on a submit round trip; past this the request is aborted and the user can retry
+const SUBMIT_TIMEOUT_MS = 10_000;
+
+// Project details cap — keeps a quote request well inside the 64KB body limit on keepalive fetches
+const MESSAGE_MAX_LENGTH = 5000;
+const KEEPALIVE_MAX_BYTES = 64 * 1024;
+
+// Class-name variants hoisted to module scope so each render reuses the same strings
+const SUBMIT_BTN = 'btn-primary';
+const SUBMIT_BTN_BUSY = `${SUBMIT_BTN} opacity-70 cursor-wait`;
+
+// Submit lifecycle held as one state object: each step of a submit is a single setStatus call,
+// so the form re-renders once per step however many of these fields change together.
+const STATUS_IDLE = { submitted: false, submitting: false, errorMessage: null };
+const STATUS_SUBMITTING = { submitted: false, submitting: true, errorMessage: null };
+const STATUS_SUBMITTED = { submitted: true, submitting: false, errorMessage: null };
+
+// In-flight requests keyed by method + url + body. A double-click before `submitting` re-renders
+// shares the first POST instead of sending a duplicate; keys linger briefly after a successful
+// response, and are dropped immediately on an error status or a network failure (including an
+// abort) so a retry — e.g. with a freshly minted reCAPTCHA token — goes straight out.
+const inflight = new Map();
+const INFLIGHT_TTL_MS = 2000;
+
+function dedupedFetch(url, init = {}, key = `${init.method || 'GET'} ${url} ${typeof init.body === 'string' ? init.body : ''}`) {
+  if (!inflight.has(key)) {
+    const promise = fetch(url, init).then(
+      (res) => {
+        if (res.ok) setTimeout(() => inflight.delete(key), INFLIGHT_TTL_MS);
+        else inflight.delete(key);
+        return res;
+      },
+      (err) => {
+        inflight.delete(key);
+        throw err;
+      },
+    );
+    inflight.set(key, promise);
+  }
+  // Each caller gets its own clone so every caller can read the body
+  return inflight.get(key).then((res) => res.clone());
+}
+
+// Settles like `promise`, but rejects with an AbortError once `signal` aborts — puts steps that take
+// no signal themselves (reCAPTCHA token minting) under the same submit timeout as the fetch
+function abortable(promise, signal) {
+  return Promise.race([
+    promise,
+    new Promise((_, reject) => {
+      signal.addEventListener('abort', () => reject(new DOMException('Aborted', 'AbortError')), { once: true });
+    }),
+  ]);
+}
+
+// Form markup. Memoized so ContactForm's reCAPTCHA loading flags never re-render it;
+// owns the uncontrolled field refs and hands plain field values to onSubmit.
+const QuoteForm = memo(function QuoteForm({ submitted, submitting, errorMessage, onSubmit, onArm }) {
+  const nameRef = useRef(null);
+  const emailRef = useRef(null);
+  const companyRef = useRef(null);
+  const messageRef = useRef(null);
+  const gotchaRef = useRef(null);
+
+  const handleSubmit = useCallback((e) => {
+    e.preventDefault();
+    onSubmit({
+      name: nameRef.current.value,
+      email: emailRef.current.value,
+      company: companyRef.current.value,
+      message: messageRef.current.value,
+      _gotcha: gotchaRef.current.value,
+      // Time since navigation start on this clock only: the server-rendered form is usable before
+      // hydration, and client/server clock skew can't make a person look like a bot
+      _fillMs: Math.round(performance.now()),
+    }, e.currentTarget);
+  }, [onSubmit]);
+
+  if (submitted) {
+    return <div className="text-green-600 text-center font-medium" role="status" aria-live="polite">Thank you! Your request has been received — we’ll be in touch shortly.</div>;
+  }
+
+  return (
+    <form onSubmit={handleSubmit} onFocus={onArm} onPointerDown={onArm} className="grid grid-cols-1 gap-4" aria-describedby="form-help">
+      <input ref={nameRef} name="name" required placeholder="Full Name" className="form-field" />
+      <input ref={emailRef} name="email" type="email" required placeholder="Email Address" className="form-field" />
+      <input ref={companyRef} name="company" placeholder="Company (optional)" className="form-field" />
+      <textarea ref={messageRef} name="message" required maxLength={MESSAGE_MAX_LENGTH} placeholder="Project details (scope, locations, deliverables)" className="form-field h-32"></textarea>
+      {/* Honeypot — hidden from people and assistive tech, filled in by naive bots */}
+      <input ref={gotchaRef} name="_gotcha" tabIndex={-1} autoComplete="off" aria-hidden="true" className="hidden" />
+
+      {/* Provide feedback while token or submit in progress */}
+      {errorMessage && <div className="text-red-600 text-sm" role="alert">{errorMessage}</div>}
+
+      <div className="flex justify-between items-center">
+        <BrochureLink className="text-sm text-gray-600 underline">Download brochure</BrochureLink>
+        <div>
+          <button type="submit" disabled={submitting} className={submitting ? SUBMIT_BTN_BUSY : SUBMIT_BTN}>
+            {submitting ? 'Submitting…' : 'Submit Request'}
+          </button>
+        </div>
+      </div>
+    </form>
+  );
+});
+
+export default function ContactForm() {
+  const [status, setStatus] = useState(STATUS_IDLE);
+  const [shouldLoadRecaptcha, setShouldLoadRecaptcha] = useState(false);
+  // Last minted v3 token, reused across retries until it expires or the server spends it
+  const tokenRef = useRef({ token: null, ts: 0 });
+
+  // Decide when reCAPTCHA mounts: not at all if already on the page, otherwise when the quote form nears the viewport
+  useEffect(() => {
+    if (!RECAPTCHA_KEY) return;
+
+    // grecaptcha already on the page (e.g. loaded by a previous route) — nothing to mount
+    if (window.grecaptcha && typeof window.grecaptcha.execute === 'function') return;
+
+    // Only mount the reCAPTCHA script once the quote form nears the viewport
+    const quote = document.getElementById('quote');
+    if (!quote || typeof IntersectionObserver === 'undefined') {
+      setShouldLoadRecaptcha(true);
+      return;
+    }
+    const obs = new IntersectionObserver(([entry]) => {
+      if (entry.isIntersecting) {
+        startTransition(() => setShouldLoadRecaptcha(true));
+        obs.disconnect();
+      }
+    }, { rootMargin: '200px' });
+    obs.observe(quote);
+    return () => obs.disconnect();
+  }, []);
+
+  // First interaction with the form loads reCAPTCHA even if the observer hasn't fired yet.
+  // Mounting the script tags is a transition so the focus / first keystroke it rides on stays urgent.
+  const armRecaptcha = useCallback(() => startTransition(() => setShouldLoadRecaptcha(true)), []);
+
+  // Resolves to a v3 token (reused while fresh), or null when reCAPTCHA is not configured
+  const getRecaptchaToken = useCallback(async () => {
+    if (!RECAPTCHA_KEY) return null;
+    if (!window.grecaptcha || typeof window.grecaptcha.execute !== 'function') {
+      throw new Error('reCAPTCHA not ready. Please try again.');
+    }
+    const now = Date.now();
+    if (!tokenRef.current.token || now - tokenRef.current.ts > RECAPTCHA_TOKEN_TTL_MS) {
+      // api.js can define execute before it is initialised; ready() resolves once it is
+      await new Promise((resolve) => window.grecaptcha.ready(resolve));
+      // execute with action 'submit' — adjust action name as needed for analytics
+      tokenRef.current = { token: await window.grecaptcha.execute(RECAPTCHA_KEY, { action: 'submit' }), ts: now };
+    }
+    return tokenRef.current.token;
+  }, []);
+
+  const submitQuote = useCallback(async (fields, form) => {
+    // disable multiple submissions and clear any previous error
+    setStatus(STATUS_SUBMITTING);
+    const ctrl = new AbortController();
+    const timeout = setTimeout(() => ctrl.abort(), SUBMIT_TIMEOUT_MS);
+    // Tokens are single-use. /api/submit only answers 400 before verifying, so that is the one case
+    // the token survives; any other response, a timeout or a network error may have spent it.
+    let keepToken = false;
+
+    try {
+      // Start minting the reCAPTCHA token first — it doesn't depend on the payload, so the round trip overlaps body prep
+      const tokenPromise = getRecaptchaToken();
+
+      // Plain-object payload from the field values QuoteForm read off its refs
+      const { _fillMs, ...formFields } = fields;
+      const payload = { ...formFields };
+      // Dedupe on the form fields only — concurrent clicks may each mint a different token and
+      // report a different fill time
+      const dedupeKey = `POST /api/submit ${JSON.stringify(payload)}`;
+      payload._fillMs = _fillMs;
+
+      // A blocked gstatic bundle leaves grecaptcha.ready/execute pending forever; the timeout still applies
+      const token = await abortable(tokenPromise, ctrl.signal);
+      if (token) payload.recaptchaToken = token;
+
+      const body = JSON.stringify(payload);
+
+      // Single same-origin POST — /api/submit verifies the token and fans out to Formspree, Slack and Sheets
+      const res = await dedupedFetch('/api/submit', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json', Accept: 'application/json' },
+        body,
+        // Lets the POST finish even if the visitor navigates away straight after clicking; browsers
+        // reject keepalive bodies over 64KB outright, so larger ones go out as a normal request
+        keepalive: new TextEncoder().encode(body).length <= KEEPALIVE_MAX_BYTES,
+        signal: ctrl.signal,
+      }, dedupeKey);
+
+      keepToken = res.status === 400;
+
+      if (!res.ok) {
+        const data = await res.json().catch(() => ({}));
+        console.error('Submit error:', data);
+        throw new Error(data?.message || 'Submission failed');
+      }
+
+      form.reset();
+      setStatus(STATUS_SUBMITTED);
+    } catch (err) {
+      console.error(err);
+      // Timed out — surface it and let the user decide to retry rather than retrying automatically
+      setStatus({
+        ...STATUS_IDLE,
+        errorMessage: err?.name === 'AbortError'
+          ? 'Request timed out — please retry.'
+          : (err?.message || 'Something went wrong. Please try again.'),
+      });
+    } finally {
+      clearTimeout(timeout);
+      if (!keepToken) tokenRef.current = { token: null, ts: 0 };
+    }
+  }, [getRecaptchaToken]);
+
+  // Submitting without the script surfaces getRecaptchaToken's "not ready" error, so just log it here
+  const handleRecaptchaError = useCallback(() => {
+    console.error('Failed to load reCAPTCHA script');
+  }, []);
+
+  return (
+    <>
+      {/* Preconnects and script mount only once the quote form is near or touched */}
+      {RECAPTCHA_KEY && shouldLoadRecaptcha && (
+        <RecaptchaScript siteKey={RECAPTCHA_KEY} onError={handleRecaptchaError} />
+      )}
+
+      <QuoteForm submitted={status.submitted} submitting={status.submitting} errorMessage={status.errorMessage} onSubmit={submitQuote} onArm={armRecaptcha} />
+    </>
+  );
+}
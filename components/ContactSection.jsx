@@ -0,0 +1,13 @@
+// Contact details — static text and mailto:/tel: links, nothing interactive.
+export default function ContactSection() {
+  return (
+    <section id="contact" className="py-12 bg-blue-900 text-white">
+      <div className="max-w-4xl mx-auto px-6 text-center">
+        <h3 className="text-xl font-semibold mb-2">Contact</h3>
+        <p className="text-sm">Email: <a href="mailto:fpcaddesign@gmail.com" className="underline">fpcaddesign@gmail.com</a></p>
+        <p className="text-sm">Phone: <a href="tel:+16475732397" className="underline">(647) 573-2397</a></p>
+        <p className="text-sm">Location: Waterloo Region, Ontario</p>
+      </div>
+    </section>
+  );
+}
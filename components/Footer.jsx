@@ -0,0 +1,12 @@
+// Inlined at build time from next.config.js `env`, so server HTML and client bundle agree and every
+// rebuild refreshes it.
+const CURRENT_YEAR = process.env.BUILD_YEAR;
+
+// Site footer — static text, rendered under LazyHydrate ssrOnly so it is never hydrated.
+export default function Footer() {
+  return (
+    <footer className="py-6 text-center text-sm text-gray-600">
+      © {CURRENT_YEAR} FP CAD Design Services — All rights reserved.
+    </footer>
+  );
+}
@@ -0,0 +1,35 @@
+import { memo } from 'react';
+
+// Logo artwork is emitted once as <symbol>s in LogoSprite; each Logo instance is a lightweight <use> reference.
+// Render LogoSprite once per page, above any Logo.
+export const LogoSprite = memo(function LogoSprite() {
+  return (
+    <svg xmlns="http://www.w3.org/2000/svg" style={{ display: 'none' }} aria-hidden>
+      <symbol id="fp-logo" viewBox="0 0 100 100">
+        <rect x="2" y="2" width="96" height="96" rx="12" fill="#0F4C81" />
+        <g transform="translate(18,22)" fill="#fff">
+          <path d="M6 50 L18 10 L30 50 Z" />
+          <rect x="36" y="10" width="8" height="40" rx="2" />
+          <rect x="54" y="10" width="8" height="40" rx="2" />
+        </g>
+      </symbol>
+      <symbol id="fp-logo-monogram" viewBox="0 0 100 100"><circle cx="50" cy="50" r="44" fill="#0F4C81"/><text x="50%" y="58%" fill="#fff" fontSize="34" textAnchor="middle" fontFamily="sans-serif">FP</text></symbol>
+      <symbol id="fp-logo-geo" viewBox="0 0 100 100"><rect x="10" y="10" width="80" height="80" rx="14" fill="#0F4C81"/><polygon points="30,70 50,20 70,70" fill="#fff"/></symbol>
+    </svg>
+  );
+});
+
+// Memoized so parent state changes (submitting, errors) skip the static SVG subtrees.
+export const Logo = memo(function Logo({ className = 'w-10 h-10' }) {
+  return <svg className={className} viewBox="0 0 100 100" aria-hidden><use href="#fp-logo" /></svg>;
+});
+
+export const MonogramLogo = memo(function MonogramLogo({ className = 'w-10 h-10' }) {
+  return <svg className={className} viewBox="0 0 100 100" aria-hidden><use href="#fp-logo-monogram" /></svg>;
+});
+
+export const GeoLogo = memo(function GeoLogo({ className = 'w-10 h-10' }) {
+  return <svg className={className} viewBox="0 0 100 100" aria-hidden><use href="#fp-logo-geo" /></svg>;
+});
+
+export default Logo;
@@ -0,0 +1,45 @@
+// Logo selector + brochure download for the About section.
+// Owns its selection state so picking a logo never re-renders the rest of the page.
+
+import { memo, useCallback, useState } from 'react';
+import BrochureLink from './BrochureLink';
+import { GeoLogo, Logo, MonogramLogo } from './Logo';
+
+const LOGO_BTN_BASE = 'p-2 border rounded';
+const LOGO_BTN_SELECTED = `${LOGO_BTN_BASE} ring-2 ring-blue-500`;
+
+// Takes the icon as a component (not an element) so props stay referentially stable.
+// The id rides on data-id, so every button shares the parent's single onSelect handler.
+const LogoButton = memo(function LogoButton({ id, label, icon: Icon, selected, onSelect }) {
+  return (
+    <button data-id={id} onClick={onSelect} className={selected ? LOGO_BTN_SELECTED : LOGO_BTN_BASE} aria-label={label}>
+      <Icon className="w-12 h-12" />
+    </button>
+  );
+});
+
+export default function LogoSelector() {
+  const [selectedLogo, setSelectedLogo] = useState('default');
+  // One stable handler for all buttons — memoized LogoButtons only re-render when their own `selected` flips
+  const selectLogo = useCallback((e) => setSelectedLogo(e.currentTarget.dataset.id), []);
+
+  return (
+    <div className="mt-8 flex flex-col md:flex-row items-center justify-center gap-6">
+      <div className="text-center">
+        <div className="mb-2 font-medium">Logo options</div>
+        <div className="flex gap-3 items-center">
+          <LogoButton id="default" label="Default logo" icon={Logo} selected={selectedLogo==='default'} onSelect={selectLogo} />
+          <LogoButton id="monogram" label="Monogram logo" icon={MonogramLogo} selected={selectedLogo==='monogram'} onSelect={selectLogo} />
+          <LogoButton id="geo" label="Geometric logo" icon={GeoLogo} selected={selectedLogo==='geo'} onSelect={selectLogo} />
+        </div>
+        <div className="mt-3 text-xs text-gray-500">Selected: {selectedLogo}</div>
+      </div>
+
+      <div className="text-center">
+        <div className="mb-2 font-medium">Brochure</div>
+        <BrochureLink className="inline-block bg-blue-900 text-white px-4 py-2 rounded">Download PDF</BrochureLink>
+        <div className="text-xs text-gray-500 mt-2">Placeholder brochure (replace /assets/FP-CAD-Brochure.pdf with your brochure)</div>
+      </div>
+    </div>
+  );
+}
@@ -0,0 +1,24 @@
+// reCAPTCHA v3 loader — preconnect hints plus the api.js script. Only imported (via next/dynamic) when
+// ContactForm was built with a site key, so key-less deployments never ship this chunk.
+
+import Head from 'next/head';
+import Script from 'next/script';
+
+export default function RecaptchaScript({ siteKey, onError }) {
+  return (
+    <>
+      <Head>
+        {/* api.js is a plain credentialed script fetch; only the gstatic bundle loads with crossorigin=anonymous */}
+        <link rel="preconnect" href="https://www.google.com" />
+        <link rel="preconnect" href="https://www.gstatic.com" crossOrigin="" />
+      </Head>
+      <Script
+        // next/script dedupes by id, so remounting the page never injects a second copy
+        id="recaptcha-v3"
+        src={`https://www.google.com/recaptcha/api.js?render=${siteKey}`}
+        strategy="lazyOnload"
+        onError={onError}
+      />
+    </>
+  );
+}
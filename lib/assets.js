@@ -0,0 +1,9 @@
+// Public asset URLs. With NEXT_PUBLIC_CDN_URL set (the same origin used for next.config assetPrefix)
+// files under public/ are served from the CDN; left unset they stay same-origin paths.
+const CDN_URL = process.env.NEXT_PUBLIC_CDN_URL ?? '';
+
+export function cdnUrl(path) {
+  return `${CDN_URL}${path}`;
+}
+
+export const BROCHURE_URL = cdnUrl('/assets/FP-CAD-Brochure.pdf');
@@ -0,0 +1,66 @@
+// Google Sheets append over the REST API, authenticated with a service-account JWT signed via WebCrypto.
+// Edge-runtime safe: no Node SDK (googleapis) and no Node crypto.
+
+const TOKEN_URL = 'https://oauth2.googleapis.com/token';
+const SHEETS_SCOPE = 'https://www.googleapis.com/auth/spreadsheets';
+
+// Access tokens last an hour; reuse one per isolate and refresh a minute early
+let cachedToken = { value: null, expiresAt: 0 };
+
+function base64url(input) {
+  const bytes = typeof input === 'string' ? new TextEncoder().encode(input) : new Uint8Array(input);
+  let binary = '';
+  for (const byte of bytes) binary += String.fromCharCode(byte);
+  return btoa(binary).replace(/\+/g, '-').replace(/\//g, '_').replace(/=+$/, '');
+}
+
+function importPrivateKey(pem) {
+  // Private keys pasted into env dashboards usually carry escaped newlines
+  const body = pem
+    .replace(/\\n/g, '\n')
+    .replace(/-----(BEGIN|END) PRIVATE KEY-----/g, '')
+    .replace(/\s+/g, '');
+  const der = Uint8Array.from(atob(body), (c) => c.charCodeAt(0));
+  return crypto.subtle.importKey('pkcs8', der, { name: 'RSASSA-PKCS1-v1_5', hash: 'SHA-256' }, false, ['sign']);
+}
+
+async function getAccessToken(clientEmail, privateKey) {
+  const now = Math.floor(Date.now() / 1000);
+  if (cachedToken.value && now < cachedToken.expiresAt) return cachedToken.value;
+
+  const header = base64url(JSON.stringify({ alg: 'RS256', typ: 'JWT' }));
+  const claims = base64url(JSON.stringify({ iss: clientEmail, scope: SHEETS_SCOPE, aud: TOKEN_URL, iat: now, exp: now + 3600 }));
+  const key = await importPrivateKey(privateKey);
+  const signature = await crypto.subtle.sign('RSASSA-PKCS1-v1_5', key, new TextEncoder().encode(`${header}.${claims}`));
+
+  const res = await fetch(TOKEN_URL, {
+    method: 'POST',
+    body: new URLSearchParams({
+      grant_type: 'urn:ietf:params:oauth:grant-type:jwt-bearer',
+      assertion: `${header}.${claims}.${base64url(signature)}`,
+    }),
+  });
+  if (!res.ok) throw new Error(`Google token exchange failed (${res.status})`);
+  const data = await res.json();
+  cachedToken = { value: data.access_token, expiresAt: now + (data.expires_in || 3600) - 60 };
+  return cachedToken.value;
+}
+
+// Appends one row to the configured sheet; a no-op when the GOOGLE_* env vars are not set.
+export async function appendRow(values) {
+  const { GOOGLE_SHEETS_ID, GOOGLE_SERVICE_ACCOUNT_EMAIL, GOOGLE_PRIVATE_KEY } = process.env;
+  if (!GOOGLE_SHEETS_ID || !GOOGLE_SERVICE_ACCOUNT_EMAIL || !GOOGLE_PRIVATE_KEY) return;
+
+  const token = await getAccessToken(GOOGLE_SERVICE_ACCOUNT_EMAIL, GOOGLE_PRIVATE_KEY);
+  const range = encodeURIComponent(process.env.GOOGLE_SHEETS_RANGE || 'Sheet1!A:E');
+  // RAW stores the public form input verbatim; USER_ENTERED would turn a leading `=` into a live formula
+  const res = await fetch(
+    `https://sheets.googleapis.com/v4/spreadsheets/${GOOGLE_SHEETS_ID}/values/${range}:append?valueInputOption=RAW`,
+    {
+      method: 'POST',
+      headers: { Authorization: `Bearer ${token}`, 'Content-Type': 'application/json' },
+      body: JSON.stringify({ values: [values] }),
+    },
+  );
+  if (!res.ok) throw new Error(`Sheets append failed (${res.status})`);
+}
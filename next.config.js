@@ -1 +1,40 @@
-const nextConfig = { reactStrictMode: true }; module.exports = nextConfig;
\ No newline at end of file
+const nextConfig = {
+  reactStrictMode: true,
+  // Serve /_next/static from the CDN when configured; public/ files use lib/assets cdnUrl() with the same origin
+  assetPrefix: process.env.NEXT_PUBLIC_CDN_URL || '',
+  // Build-time constants inlined into the bundle (footer copyright year, reCAPTCHA site key).
+  // The site key is listed even when unset so it still folds to '' and key-less builds drop the
+  // reCAPTCHA code; Next only inlines NEXT_PUBLIC_* vars that exist at build time.
+  env: {
+    BUILD_YEAR: String(new Date().getFullYear()),
+    NEXT_PUBLIC_RECAPTCHA_SITE_KEY: process.env.NEXT_PUBLIC_RECAPTCHA_SITE_KEY || '',
+  },
+  experimental: {
+    // Inline the above-the-fold CSS (via critters) into the static HTML and load the full stylesheet without blocking paint
+    optimizeCss: true,
+  },
+
+  async headers() {
+    return [
+      {
+        // Static marketing page — let the CDN cache it and revalidate in the background
+        source: '/',
+        headers: [{ key: 'Cache-Control', value: 'public, s-maxage=3600, stale-while-revalidate=86400' }],
+      },
+      {
+        // Files under public/assets keep unversioned names and get replaced in place (the brochure is a
+        // placeholder), so cache them for an hour and revalidate in the background rather than pinning them
+        source: '/assets/:all*',
+        headers: [{ key: 'Cache-Control', value: 'public, max-age=3600, stale-while-revalidate=86400' }],
+      },
+      {
+        // The app always sends the plain PDF; the CDN may answer the same URL with the .br sibling
+        // written by scripts/compress-assets.js, so caches must key on Accept-Encoding
+        source: '/assets/:file.pdf',
+        headers: [{ key: 'Vary', value: 'Accept-Encoding' }],
+      },
+    ];
+  },
+};
+
+module.exports = nextConfig;
@@ -0,0 +1,135 @@
+// Quote form endpoint (Edge runtime) — verifies reCAPTCHA once, then fans out to Formspree, Slack and Google Sheets.
+// Env (server-only, no NEXT_PUBLIC_ prefix): RECAPTCHA_SECRET_KEY, SLACK_WEBHOOK,
+// GOOGLE_SHEETS_ID, GOOGLE_SERVICE_ACCOUNT_EMAIL, GOOGLE_PRIVATE_KEY, optional GOOGLE_SHEETS_RANGE.
+
+import { appendRow } from '../../lib/sheets';
+
+// Same-origin edge function: the browser reuses its connection to the site instead of a cross-origin POST
+export const config = { runtime: 'edge' };
+
+const FORMSPREE_ENDPOINT = 'https://formspree.io/f/mgvejzdo';
+const RECAPTCHA_VERIFY_URL = 'https://www.google.com/recaptcha/api/siteverify';
+const RECAPTCHA_MIN_SCORE = 0.5;
+// Anything submitted sooner than this after the page started loading (as timed by the client) is treated as a bot
+const MIN_FILL_MS = 3000;
+
+// Formspree control fields, set here rather than taken from the body so nobody can use the
+// endpoint to have Formspree email arbitrary text to an arbitrary address
+const QUOTE_SUBJECT = 'New project quote request';
+const QUOTE_AUTORESPONSE = 'Thank you for contacting FP CAD Design Services. We’ve received your message and will get back to you soon.';
+
+// Only these fields are forwarded; anything else in the body is dropped
+const FORM_FIELDS = ['name', 'email', 'company', 'message'];
+
+function pickFields(body) {
+  const fields = {};
+  for (const key of FORM_FIELDS) {
+    if (typeof body?.[key] === 'string') fields[key] = body[key];
+  }
+  return fields;
+}
+
+// Zero-cost bot screen that runs before (or without) reCAPTCHA: a filled honeypot or an instant submit.
+// Returns the reason a submission looks automated, or null when it passes.
+function automatedReason(body) {
+  if (body?._gotcha) return 'honeypot filled';
+  // A missing or non-numeric fill time fails the comparison and counts as automated too
+  const fillMs = Number(body?._fillMs);
+  if (!(fillMs >= MIN_FILL_MS)) return Number.isFinite(fillMs) ? `fill time ${fillMs}ms` : 'fill time missing';
+  return null;
+}
+
+async function verifyRecaptcha(token, remoteip) {
+  const secret = process.env.RECAPTCHA_SECRET_KEY;
+  // No secret configured — reCAPTCHA is disabled for this deployment
+  if (!secret) return true;
+  if (!token) return false;
+
+  const params = new URLSearchParams({ secret, response: token });
+  if (remoteip) params.append('remoteip', remoteip);
+  const res = await fetch(RECAPTCHA_VERIFY_URL, { method: 'POST', body: params });
+  const data = await res.json().catch(() => ({}));
+  // v3 returns a score; treat a missing score (v2 keys) as a pass when success is true
+  return Boolean(data.success) && (typeof data.score !== 'number' || data.score >= RECAPTCHA_MIN_SCORE);
+}
+
+async function sendToFormspree(fields) {
+  const res = await fetch(FORMSPREE_ENDPOINT, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json', Accept: 'application/json' },
+    body: JSON.stringify({ ...fields, _subject: QUOTE_SUBJECT, _autoresponse: QUOTE_AUTORESPONSE }),
+  });
+  if (!res.ok) {
+    const data = await res.json().catch(() => ({}));
+    console.error('Formspree error:', data);
+    const message = Array.isArray(data?.errors)
+      ? data.errors.map((err) => err.message).join(', ')
+      : (Array.isArray(data?.error) ? data.error.join(', ') : data?.error);
+    throw new Error(message || 'Submission failed');
+  }
+}
+
+async function sendToSlack(fields) {
+  const slackWebhook = process.env.SLACK_WEBHOOK;
+  if (!slackWebhook) return;
+  const text = `New quote request from ${fields.name} — ${fields.company || 'no company'} — ${fields.email}`;
+  await fetch(slackWebhook, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ text }),
+  });
+}
+
+function sendToSheets(fields) {
+  return appendRow([new Date().toISOString(), fields.name, fields.email, fields.company || '', fields.message]);
+}
+
+function json(status, body, headers) {
+  return new Response(JSON.stringify(body), {
+    status,
+    headers: { 'Content-Type': 'application/json', ...headers },
+  });
+}
+
+export default async function handler(req, event) {
+  if (req.method !== 'POST') {
+    return json(405, { message: 'Method not allowed' }, { Allow: 'POST' });
+  }
+
+  const body = await req.json().catch(() => ({}));
+  const fields = pickFields(body);
+  if (!fields.name || !fields.email || !fields.message) {
+    return json(400, { message: 'Name, email and project details are required.' });
+  }
+
+  // Answer bots as if they succeeded so they have nothing to adapt to; nothing is forwarded, but the
+  // drop is logged so false positives on real leads can be spotted
+  const reason = automatedReason(body);
+  if (reason) {
+    console.warn(`Dropped quote submission as automated (${reason}) from ${fields.email}`);
+    return json(200, { ok: true });
+  }
+
+  try {
+    const remoteip = req.headers.get('x-forwarded-for')?.split(',')[0]?.trim();
+    // 403 (not 400) so the client knows the token has been spent and must be re-minted
+    if (!(await verifyRecaptcha(body?.recaptchaToken, remoteip))) {
+      return json(403, { message: 'reCAPTCHA verification failed. Please try again.' });
+    }
+
+    // Formspree is the record of the lead; if it fails, nothing else is logged, so a retry can't duplicate it
+    await sendToFormspree(fields);
+
+    // Slack and Sheets are best-effort notifications of an accepted lead. The response doesn't wait
+    // for them; waitUntil keeps the isolate alive until both settle.
+    event.waitUntil(Promise.all([
+      sendToSlack(fields).catch((e) => console.error('Slack send error', e)),
+      sendToSheets(fields).catch((e) => console.error('Sheets send error', e)),
+    ]));
+
+    return json(200, { ok: true });
+  } catch (err) {
+    console.error(err);
+    return json(502, { message: err?.message || 'Submission failed' });
+  }
+}
@@ -0,0 +1,133 @@
+
+// "Homepage Updated" — Launch-ready Next.js React component
+// Uses: Tailwind CSS, Google reCAPTCHA v3 (invisible), Formspree, optional Slack and Sheets integrations (via /api/submit).
+
+import dynamic from 'next/dynamic';
+import Head from 'next/head';
+import Image from 'next/image';
+import LazyHydrate from 'react-lazy-hydration';
+import ContactForm from '../components/ContactForm';
+import ContactSection from '../components/ContactSection';
+import Footer from '../components/Footer';
+import { Logo, LogoSprite } from '../components/Logo';
+import { cdnUrl } from '../lib/assets';
+
+// Split out of the page bundle. Because it renders during SSR, its chunk is still listed in the
+// initial HTML and downloads at page load; LazyHydrate below only defers its hydration.
+const LogoSelector = dynamic(() => import('../components/LogoSelector'), { ssr: true });
+
+// With no getStaticProps/getInitialProps the page qualifies for Automatic Static Optimization
+// and is emitted as static HTML at build time.
+export default function HomePage() {
+  return (
+    <div className="min-h-screen font-sans text-gray-800 bg-white">
+      <LogoSprite />
+      <Head>
+        <title>FP CAD Design Services — Precision CAD Drafting for Telecom</title>
+        <meta name="description" content="FP CAD Design Services specializes in underground telecommunication CAD drafting — fiber, conduit, and micro-duct systems. Request a quote today." />
+        <meta name="viewport" content="width=device-width,initial-scale=1" />
+        <meta property="og:title" content="FP CAD Design Services" />
+      </Head>
+
+      <header className="sticky top-0 bg-white/90 backdrop-blur z-40 shadow-sm">
+        <nav className="max-w-6xl mx-auto px-6 py-4 flex items-center justify-between">
+          <div className="flex items-center gap-3">
+            <Logo />
+            <div>
+              <div className="text-lg font-bold">FP CAD Design Services</div>
+              <div className="text-xs text-gray-500">Waterloo Region, Ontario</div>
+            </div>
+          </div>
+          <ul className="hidden md:flex items-center gap-6 text-sm">
+            <li><a href="#about" className="hover:underline">About</a></li>
+            <li><a href="#services" className="hover:underline">Services</a></li>
+            <li><a href="#quote" className="hover:underline">Request a Quote</a></li>
+            <li><a href="#contact" className="hover:underline">Contact</a></li>
+          </ul>
+          <a href="#quote" className="hidden md:inline-block bg-blue-900 text-white px-4 py-2 rounded-lg text-sm">Request a Quote</a>
+        </nav>
+      </header>
+
+      <main>
+        {/* Hero */}
+        <section className="bg-gradient-to-b from-blue-900 to-blue-800 text-white py-20">
+          <div className="max-w-6xl mx-auto px-6 grid md:grid-cols-2 gap-8 items-center">
+            <div>
+              {/* Entrance animation is pure CSS (.hero-title in styles/globals.css) */}
+              <h1 className="hero-title text-4xl md:text-5xl font-extrabold leading-tight mb-4">
+                Precision CAD Drafting for Underground Telecom
+              </h1>
+              <p className="text-lg text-blue-100 mb-6">FP CAD Design Services specializes in underground telecommunication design — fiber, conduit, and micro-duct systems — delivering permit-ready drawings for telecoms, engineering firms, and contractors.</p>
+              <a href="#quote" className="inline-block bg-white text-blue-900 font-semibold px-5 py-3 rounded-lg shadow">Get a Quote</a>
+            </div>
+            <div className="hidden md:block">
+              <div className="bg-white/10 p-8 rounded-xl">
+                {/* Decorative mockup served as a static, CDN-cacheable asset (next/image skips optimizing SVGs) */}
+                <Image src={cdnUrl('/hero-mock.svg')} width={400} height={300} priority unoptimized alt="" className="w-full h-64 object-contain" />
+              </div>
+            </div>
+          </div>
+        </section>
+
+        {/* About */}
+        <section id="about" className="py-16">
+          <div className="max-w-5xl mx-auto px-6 text-center">
+            <h2 className="text-3xl font-semibold text-blue-900 mb-4">About FP CAD Design Services</h2>
+            <p className="text-lg text-gray-700">FP CAD Design Services is a professional CAD drafting business based in the Waterloo Region, Ontario. The company specializes in underground telecommunication design, including fiber, conduit, and micro-duct systems. Founded by Fritz Point-Du-Jour, who brings over nine years of experience as a CAD Technician, the business provides precise, permit-ready drawings for telecom companies, engineering firms, and local contractors.</p>
+
+            {/* Logo selector + download brochure — server-rendered, hydrated once scrolled into view */}
+            <LazyHydrate whenVisible>
+              <LogoSelector />
+            </LazyHydrate>
+          </div>
+        </section>
+
+        {/* Services */}
+        <LazyHydrate whenVisible>
+          <section id="services" className="py-16 bg-gray-50">
+            <div className="max-w-6xl mx-auto px-6">
+              <h2 className="text-3xl font-semibold text-center text-blue-900 mb-8">Our Services</h2>
+              <div className="grid md:grid-cols-3 gap-6">
+                <div className="bg-white p-6 rounded-xl shadow">
+                  <h3 className="font-semibold text-lg mb-2">Underground Fiber Network Design</h3>
+                  <p className="text-sm text-gray-600">Detailed CAD layouts for underground fiber optic installations — conduits, micro-ducts and jointing.</p>
+                </div>
+                <div className="bg-white p-6 rounded-xl shadow">
+                  <h3 className="font-semibold text-lg mb-2">Permit & Construction Drawings</h3>
+                  <p className="text-sm text-gray-600">Permit-ready drawings that meet municipal and utility standards for seamless permitting and construction.</p>
+                </div>
+                <div className="bg-white p-6 rounded-xl shadow">
+                  <h3 className="font-semibold text-lg mb-2">As-Built & Redline Updates</h3>
+                  <p className="text-sm text-gray-600">Accurate as-built documentation and redline updates after construction or field changes.</p>
+                </div>
+              </div>
+            </div>
+          </section>
+        </LazyHydrate>
+
+        {/* Quote Form */}
+        <section id="quote" className="py-16">
+          <div className="max-w-3xl mx-auto px-6">
+            <h2 className="text-2xl font-semibold text-center text-blue-900 mb-4">Request a Quote</h2>
+            <p className="text-center text-gray-600 mb-6">Tell us about your project and we’ll reply with a tailored quote.</p>
+
+            <div className="bg-white p-6 rounded-xl shadow">
+              <ContactForm />
+            </div>
+
+            <p className="muted-note" id="form-help">Integrations available: Slack webhook and Google Sheets (handled server-side by /api/submit). See deployment notes in the project README.</p>
+          </div>
+        </section>
+
+        {/* Contact — static text and links only, so it is server-rendered and never hydrated */}
+        <LazyHydrate ssrOnly>
+          <ContactSection />
+        </LazyHydrate>
+      </main>
+
+      <LazyHydrate ssrOnly>
+        <Footer />
+      </LazyHydrate>
+    </div>
+  );
+}
@@ -0,0 +1,23 @@
+// Pre-compresses the PDFs in public/assets with Brotli (quality 11) so the server never compresses per request.
+// Runs as `prebuild`; the CDN serving public/assets (NEXT_PUBLIC_CDN_URL) hands the .br sibling to clients
+// that send Accept-Encoding: br. The app itself always serves the plain file.
+
+const fs = require('fs');
+const path = require('path');
+const zlib = require('zlib');
+
+const ASSETS_DIR = path.join(__dirname, '..', 'public', 'assets');
+
+for (const name of fs.readdirSync(ASSETS_DIR)) {
+  if (!name.endsWith('.pdf')) continue;
+  const file = path.join(ASSETS_DIR, name);
+  const input = fs.readFileSync(file);
+  const output = zlib.brotliCompressSync(input, {
+    params: {
+      [zlib.constants.BROTLI_PARAM_QUALITY]: zlib.constants.BROTLI_MAX_QUALITY,
+      [zlib.constants.BROTLI_PARAM_SIZE_HINT]: input.length,
+    },
+  });
+  fs.writeFileSync(`${file}.br`, output);
+  console.log(`${name}: ${input.length} -> ${output.length} bytes (br)`);
+}